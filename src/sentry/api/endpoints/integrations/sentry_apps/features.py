@@ -17,6 +17,7 @@ class SentryAppFeaturesEndpoint(SentryAppBaseEndpoint):
         return self.paginate(
             request=request,
             queryset=features,
+            order_by="id",
             paginator_cls=OffsetPaginator,
             on_results=lambda x: serialize(x, request.user),
         )
@@ -29,12 +29,16 @@ class OrganizationInviteRequestIndexEndpoint(OrganizationEndpoint):
     permission_classes = (InviteRequestPermissions,)
 
     def get(self, request: Request, organization) -> Response:
-        queryset = OrganizationMember.objects.filter(
-            Q(user__isnull=True),
-            Q(invite_status=InviteStatus.REQUESTED_TO_BE_INVITED.value)
-            | Q(invite_status=InviteStatus.REQUESTED_TO_JOIN.value),
-            organization=organization,
-        ).order_by("invite_status", "email")
+        queryset = (
+            OrganizationMember.objects.filter(
+                Q(user__isnull=True),
+                Q(invite_status=InviteStatus.REQUESTED_TO_BE_INVITED.value)
+                | Q(invite_status=InviteStatus.REQUESTED_TO_JOIN.value),
+                organization=organization,
+            )
+            .select_related("inviter")
+            .order_by("invite_status", "email")
+        )
 
         if organization.get_option("sentry:join_requests") is False:
             queryset = queryset.filter(invite_status=InviteStatus.REQUESTED_TO_BE_INVITED.value)
@@ -1,30 +1,38 @@
 from sentry.integrations.msteams.card_builder import AdaptiveCard
 from sentry.integrations.msteams.card_builder.base import MSTeamsMessageBuilder
 
-from .block import ActionType, create_action_block
+from .block import ActionType, create_action_block, create_text_block
 from .utils import HelpMessages
 
+# These cards are fully static, so build them once at import time. The cards
+# are only ever serialized and sent, never mutated, which makes sharing safe.
+_HELP_COMMAND_CARD: AdaptiveCard = MSTeamsMessageBuilder().build(
+    title=HelpMessages.HELP_TITLE, text=HelpMessages.HELP_MESSAGE
+)
+
+_MENTIONED_CARD: AdaptiveCard = MSTeamsMessageBuilder().build(
+    title=HelpMessages.MENTIONED_TITLE,
+    text=HelpMessages.MENTIONED_TEXT,
+    actions=[
+        create_action_block(
+            ActionType.OPEN_URL, title=HelpMessages.DOCS_BUTTON, url=HelpMessages.DOCS_URL
+        )
+    ],
+)
+
+_AVAILABLE_COMMANDS_BLOCK = create_text_block(HelpMessages.AVAILABLE_COMMANDS_TEXT)
+
 
 def build_help_command_card() -> AdaptiveCard:
-    return MSTeamsMessageBuilder().build(
-        title=HelpMessages.HELP_TITLE, text=HelpMessages.HELP_MESSAGE
-    )
+    return _HELP_COMMAND_CARD
 
 
 def build_unrecognized_command_card(command_text: str) -> AdaptiveCard:
     return MSTeamsMessageBuilder().build(
         title=HelpMessages.UNRECOGNIZED_COMMAND.format(command_text=command_text),
-        text=HelpMessages.AVAILABLE_COMMANDS_TEXT,
+        text=_AVAILABLE_COMMANDS_BLOCK,
     )
 
 
 def build_mentioned_card() -> AdaptiveCard:
-    return MSTeamsMessageBuilder().build(
-        title=HelpMessages.MENTIONED_TITLE,
-        text=HelpMessages.MENTIONED_TEXT,
-        actions=[
-            create_action_block(
-                ActionType.OPEN_URL, title=HelpMessages.DOCS_BUTTON, url=HelpMessages.DOCS_URL
-            )
-        ],
-    )
+    return _MENTIONED_CARD
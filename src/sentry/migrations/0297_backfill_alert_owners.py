@@ -3,6 +3,7 @@
 from django.db import migrations
 
 from sentry.new_migrations.migrations import CheckedMigration
+from sentry.utils.iterators import chunked
 from sentry.utils.query import RangeQuerySetWrapperWithProgressBar
 
 
@@ -12,29 +13,57 @@ def backfill_alert_owners(apps, schema_editor):
     User = apps.get_model("sentry", "User")
     Team = apps.get_model("sentry", "Team")
 
-    for alert_rule in RangeQuerySetWrapperWithProgressBar(
-        AlertRule.objects_with_snapshots.select_related("owner").all()
+    for alert_rules in chunked(
+        RangeQuerySetWrapperWithProgressBar(
+            AlertRule.objects_with_snapshots.filter(owner__isnull=False).values_list(
+                "id", "organization_id", "owner_id", "owner__type"
+            ),
+            result_value_getter=lambda item: item[0],
+        ),
+        1000,
     ):
-        owner = alert_rule.owner
-        if not owner:
-            continue
+        organization_ids = set()
+        user_actor_ids = set()
+        team_actor_ids = set()
+        for _, organization_id, owner_id, owner_type in alert_rules:
+            organization_ids.add(organization_id)
+            if owner_type == 1:  # Actor is a User
+                user_actor_ids.add(owner_id)
+            else:  # Actor is a Team
+                team_actor_ids.add(owner_id)
+
+        user_ids_by_actor_id = dict(
+            User.objects.filter(actor_id__in=user_actor_ids).values_list("actor_id", "id")
+        )
+        org_members = set(
+            OrganizationMember.objects.filter(
+                organization_id__in=organization_ids,
+                user_id__in=user_ids_by_actor_id.values(),
+            ).values_list("organization_id", "user_id")
+        )
+        org_team_actors = set(
+            Team.objects.filter(
+                actor_id__in=team_actor_ids, organization_id__in=organization_ids
+            ).values_list("organization_id", "actor_id")
+        )
+
+        invalid_alert_rule_ids = []
+        for alert_rule_id, organization_id, owner_id, owner_type in alert_rules:
+            if owner_type == 1:  # Actor is a User
+                valid_owner = (
+                    organization_id,
+                    user_ids_by_actor_id.get(owner_id),
+                ) in org_members
+            else:  # Actor is a Team
+                valid_owner = (organization_id, owner_id) in org_team_actors
 
-        valid_owner = False
-        if owner.type == 1:  # Actor is a User
-            user = User.objects.get(actor_id=owner.id)
-            if OrganizationMember.objects.filter(
-                organization_id=alert_rule.organization_id, user_id=user.id
-            ).exists():
-                valid_owner = True
-        else:  # Actor is a Team
-            if Team.objects.filter(
-                actor_id=owner.id, organization_id=alert_rule.organization_id
-            ).exists():
-                valid_owner = True
+            if not valid_owner:
+                invalid_alert_rule_ids.append(alert_rule_id)
 
-        if not valid_owner:
-            alert_rule.owner = None
-            alert_rule.save()
+        if invalid_alert_rule_ids:
+            AlertRule.objects_with_snapshots.filter(id__in=invalid_alert_rule_ids).update(
+                owner=None
+            )
 
 
 class Migration(CheckedMigration):
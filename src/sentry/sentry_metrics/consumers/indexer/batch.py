@@ -1,7 +1,8 @@
+import functools
 import logging
 import random
 from collections import defaultdict
-from typing import List, Mapping, MutableMapping, NamedTuple, Optional, Sequence, Set
+from typing import FrozenSet, List, Mapping, MutableMapping, NamedTuple, Optional, Sequence, Set
 
 import rapidjson
 import sentry_sdk
@@ -11,7 +12,7 @@ from django.conf import settings
 
 from sentry.sentry_metrics.configuration import UseCaseKey
 from sentry.sentry_metrics.consumers.indexer.common import MessageBatch
-from sentry.sentry_metrics.indexer.base import Metadata
+from sentry.sentry_metrics.indexer.base import FetchType, Metadata
 from sentry.utils import json, metrics
 
 logger = logging.getLogger(__name__)
@@ -20,7 +21,7 @@ MAX_NAME_LENGTH = 200
 MAX_TAG_KEY_LENGTH = 200
 MAX_TAG_VALUE_LENGTH = 200
 
-ACCEPTED_METRIC_TYPES = {"s", "c", "d"}  # set, counter, distribution
+ACCEPTED_METRIC_TYPES = frozenset({"s", "c", "d"})  # set, counter, distribution
 
 
 class PartitionIdxOffset(NamedTuple):
@@ -29,12 +30,7 @@ class PartitionIdxOffset(NamedTuple):
 
 
 def valid_metric_name(name: Optional[str]) -> bool:
-    if name is None:
-        return False
-    if len(name) > MAX_NAME_LENGTH:
-        return False
-
-    return True
+    return name is not None and len(name) <= MAX_NAME_LENGTH
 
 
 def _should_sample_debug_log() -> bool:
@@ -42,6 +38,11 @@ def _should_sample_debug_log() -> bool:
     return (rate > 0) and random.random() <= rate
 
 
+@functools.lru_cache(maxsize=64)
+def _encode_mapping_sources(fetch_types: FrozenSet[FetchType]) -> bytes:
+    return bytes("".join(sorted(t.value for t in fetch_types)), "utf-8")
+
+
 def invalid_metric_tags(tags: Mapping[str, str]) -> Sequence[str]:
     invalid_strs: List[str] = []
     for key, value in tags.items():
@@ -68,8 +69,8 @@ class IndexerBatch:
         for msg in self.outer_message.payload:
             partition_offset = PartitionIdxOffset(msg.partition.index, msg.offset)
             try:
-                parsed_payload = json.loads(msg.payload.value.decode("utf-8"), use_rapid_json=True)
-                self.parsed_payloads_by_offset[partition_offset] = parsed_payload
+                # rapidjson parses utf-8 bytes directly, no need to decode first
+                message = rapidjson.loads(msg.payload.value)
             except rapidjson.JSONDecodeError:
                 self.skipped_offsets.add(partition_offset)
                 logger.error(
@@ -79,7 +80,6 @@ class IndexerBatch:
                 )
                 continue
 
-        for partition_offset, message in self.parsed_payloads_by_offset.items():
             partition_idx, offset = partition_offset
             metric_name = message["name"]
             metric_type = message["type"]
@@ -125,12 +125,11 @@ class IndexerBatch:
                 self.skipped_offsets.add(partition_offset)
                 continue
 
-            parsed_strings = {
-                metric_name,
-                *tags.keys(),
-                *tags.values(),
-            }
-            org_strings[org_id].update(parsed_strings)
+            parsed_strings = org_strings[org_id]
+            parsed_strings.add(metric_name)
+            parsed_strings.update(tags.keys())
+            parsed_strings.update(tags.values())
+            self.parsed_payloads_by_offset[partition_offset] = message
 
         string_count = 0
         for org_set in org_strings:
@@ -146,10 +145,15 @@ class IndexerBatch:
         bulk_record_meta: Mapping[int, Mapping[str, Metadata]],
     ) -> List[Message[KafkaPayload]]:
         new_messages: List[Message[KafkaPayload]] = []
+        # the same tag key ids repeat across most messages in a batch, so
+        # reuse their string form instead of allocating a new one per tag
+        tag_key_strs: MutableMapping[int, str] = {}
+        # only touch the sdk scope when the org actually changes, messages
+        # from the same org tend to be grouped together in a batch
+        tagged_org_id: Optional[int] = None
 
         for message in self.outer_message.payload:
-            used_tags: Set[str] = set()
-            output_message_meta: Mapping[str, MutableMapping[str, str]] = defaultdict(dict)
+            output_message_meta: MutableMapping[str, MutableMapping[str, str]] = {}
             partition_offset = PartitionIdxOffset(message.partition.index, message.offset)
             if partition_offset in self.skipped_offsets:
                 logger.info(
@@ -161,21 +165,24 @@ class IndexerBatch:
 
             metric_name = new_payload_value["name"]
             org_id = new_payload_value["org_id"]
-            sentry_sdk.set_tag("sentry_metrics.organization_id", org_id)
+            if org_id != tagged_org_id:
+                sentry_sdk.set_tag("sentry_metrics.organization_id", org_id)
+                tagged_org_id = org_id
             tags = new_payload_value.get("tags", {})
-            used_tags.add(metric_name)
 
             new_tags: MutableMapping[str, int] = {}
+            fetch_types_encountered: Set[FetchType] = set()
             exceeded_global_quotas = 0
             exceeded_org_quotas = 0
 
             try:
+                org_mapping = mapping[org_id]
+                org_meta = bulk_record_meta[org_id]
                 for k, v in tags.items():
-                    used_tags.update({k, v})
-                    new_k = mapping[org_id][k]
-                    new_v = mapping[org_id][v]
+                    new_k = org_mapping[k]
+                    new_v = org_mapping[v]
                     if new_k is None:
-                        metadata = bulk_record_meta[org_id].get(k)
+                        metadata = org_meta.get(k)
                         if (
                             metadata
                             and metadata.fetch_type_ext
@@ -187,7 +194,7 @@ class IndexerBatch:
                         continue
 
                     if new_v is None:
-                        metadata = bulk_record_meta[org_id].get(v)
+                        metadata = org_meta.get(v)
                         if (
                             metadata
                             and metadata.fetch_type_ext
@@ -198,7 +205,18 @@ class IndexerBatch:
                             exceeded_org_quotas += 1
                         continue
 
-                    new_tags[str(new_k)] = new_v
+                    new_k_str = tag_key_strs.get(new_k)
+                    if new_k_str is None:
+                        new_k_str = tag_key_strs[new_k] = str(new_k)
+                    new_tags[new_k_str] = new_v
+
+                    for tag in (k, v):
+                        metadata = org_meta.get(tag)
+                        if metadata is not None:
+                            fetch_types_encountered.add(metadata.fetch_type)
+                            output_message_meta.setdefault(metadata.fetch_type.value, {})[
+                                str(metadata.id)
+                            ] = tag
             except KeyError:
                 logger.error("process_messages.key_error", extra={"tags": tags}, exc_info=True)
                 continue
@@ -217,25 +235,23 @@ class IndexerBatch:
                             "string_type": "tags",
                             "num_global_quotas": exceeded_global_quotas,
                             "num_org_quotas": exceeded_org_quotas,
-                            "org_batch_size": len(mapping[org_id]),
+                            "org_batch_size": len(org_mapping),
                         },
                     )
                 continue
 
-            fetch_types_encountered = set()
-            for tag in used_tags:
-                if tag in bulk_record_meta[org_id]:
-                    metadata = bulk_record_meta[org_id][tag]
-                    fetch_types_encountered.add(metadata.fetch_type)
-                    output_message_meta[metadata.fetch_type.value][str(metadata.id)] = tag
+            metadata = org_meta.get(metric_name)
+            if metadata is not None:
+                fetch_types_encountered.add(metadata.fetch_type)
+                output_message_meta.setdefault(metadata.fetch_type.value, {})[
+                    str(metadata.id)
+                ] = metric_name
 
-            mapping_header_content = bytes(
-                "".join(sorted(t.value for t in fetch_types_encountered)), "utf-8"
-            )
+            mapping_header_content = _encode_mapping_sources(frozenset(fetch_types_encountered))
             new_payload_value["tags"] = new_tags
-            new_payload_value["metric_id"] = numeric_metric_id = mapping[org_id][metric_name]
+            new_payload_value["metric_id"] = numeric_metric_id = org_mapping[metric_name]
             if numeric_metric_id is None:
-                metadata = bulk_record_meta[org_id].get(metric_name)
+                metadata = org_meta.get(metric_name)
                 metrics.incr(
                     "sentry_metrics.indexer.process_messages.dropped_message",
                     tags={
@@ -253,7 +269,7 @@ class IndexerBatch:
                                 and metadata.fetch_type_ext
                                 and metadata.fetch_type_ext.is_global
                             ),
-                            "org_batch_size": len(mapping[org_id]),
+                            "org_batch_size": len(org_mapping),
                         },
                     )
                 continue
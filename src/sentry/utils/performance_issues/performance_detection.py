@@ -1,10 +1,11 @@
-import hashlib
+import math
 import random
 from abc import ABC, abstractmethod
-from datetime import timedelta
+from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import mmh3
 import sentry_sdk
 
 from sentry import options
@@ -48,59 +49,63 @@ def detect_performance_issue(data: Event):
 # Gets some of the thresholds to perform performance detection. Can be made configurable later.
 # Thresholds are in milliseconds.
 # Allowed span ops are allowed span prefixes. (eg. 'http' would work for a span with 'http.client' as it's op)
-def get_default_detection_settings():
-    return {
-        DetectorType.DUPLICATE_SPANS: [
-            {
-                "count": 5,
-                "cumulative_duration": 500.0,  # ms
-                "allowed_span_ops": ["db", "http"],
-            }
-        ],
-        DetectorType.DUPLICATE_SPANS_HASH: [
-            {
-                "count": 5,
-                "cumulative_duration": 500.0,  # ms
-                "allowed_span_ops": ["http"],
-            },
-        ],
-        DetectorType.SEQUENTIAL_SLOW_SPANS: [
-            {
-                "count": 3,
-                "cumulative_duration": 1200.0,  # ms
-                "allowed_span_ops": ["db", "http", "ui"],
-            }
-        ],
-        DetectorType.SLOW_SPAN: [
-            {
-                "duration_threshold": 1000.0,  # ms
-                "allowed_span_ops": ["db"],
-            },
-            {
-                "duration_threshold": 2000.0,  # ms
-                "allowed_span_ops": ["http"],
-            },
-        ],
-        DetectorType.LONG_TASK_SPANS: [
-            {
-                "cumulative_duration": 500.0,  # ms
-                "allowed_span_ops": ["ui.long-task", "ui.sentry.long-task"],
-            }
-        ],
-        DetectorType.RENDER_BLOCKING_ASSET_SPAN: {
-            "fcp_minimum_threshold": 2000.0,  # ms
-            "fcp_maximum_threshold": 10000.0,  # ms
-            "fcp_ratio_threshold": 0.25,
-            "allowed_span_ops": ["resource.link", "resource.script"],
+_DEFAULT_DETECTION_SETTINGS = {
+    DetectorType.DUPLICATE_SPANS: [
+        {
+            "count": 5,
+            "cumulative_duration": 500.0,  # ms
+            "allowed_span_ops": ("db", "http"),
+        }
+    ],
+    DetectorType.DUPLICATE_SPANS_HASH: [
+        {
+            "count": 5,
+            "cumulative_duration": 500.0,  # ms
+            "allowed_span_ops": ("http",),
         },
-        DetectorType.N_PLUS_ONE_SPANS: [
-            {
-                "count": 3,
-                "start_time_threshold": 5.0,  # ms
-                "allowed_span_ops": ["http.client"],
-            }
-        ],
-    }
+    ],
+    DetectorType.SEQUENTIAL_SLOW_SPANS: [
+        {
+            "count": 3,
+            "cumulative_duration": 1200.0,  # ms
+            "allowed_span_ops": ("db", "http", "ui"),
+        }
+    ],
+    DetectorType.SLOW_SPAN: [
+        {
+            "duration_threshold": 1000.0,  # ms
+            "allowed_span_ops": ("db",),
+        },
+        {
+            "duration_threshold": 2000.0,  # ms
+            "allowed_span_ops": ("http",),
+        },
+    ],
+    DetectorType.LONG_TASK_SPANS: [
+        {
+            "cumulative_duration": 500.0,  # ms
+            "allowed_span_ops": ("ui.long-task", "ui.sentry.long-task"),
+        }
+    ],
+    DetectorType.RENDER_BLOCKING_ASSET_SPAN: {
+        "fcp_minimum_threshold": 2000.0,  # ms
+        "fcp_maximum_threshold": 10000.0,  # ms
+        "fcp_ratio_threshold": 0.25,
+        "allowed_span_ops": ("resource.link", "resource.script"),
+    },
+    DetectorType.N_PLUS_ONE_SPANS: [
+        {
+            "count": 3,
+            "start_time_threshold": 5.0,  # ms
+            "allowed_span_ops": ("http.client",),
+        }
+    ],
+}
+
+
+# The defaults are shared by every event, so detectors must treat their settings as read-only.
+def get_default_detection_settings():
+    return _DEFAULT_DETECTION_SETTINGS
 
 
 def _detect_performance_issue(data: Event, sdk_span: Any):
@@ -108,26 +113,40 @@ def _detect_performance_issue(data: Event, sdk_span: Any):
     spans = data.get("spans", [])
 
     detection_settings = get_default_detection_settings()
+    # Several detectors fingerprint the same spans, share the results for this event only
+    span_fingerprints: Dict[Tuple[str, str], str] = {}
     detectors = {
-        DetectorType.DUPLICATE_SPANS: DuplicateSpanDetector(detection_settings, data),
-        DetectorType.DUPLICATE_SPANS_HASH: DuplicateSpanHashDetector(detection_settings, data),
-        DetectorType.SLOW_SPAN: SlowSpanDetector(detection_settings, data),
-        DetectorType.SEQUENTIAL_SLOW_SPANS: SequentialSlowSpanDetector(detection_settings, data),
-        DetectorType.LONG_TASK_SPANS: LongTaskSpanDetector(detection_settings, data),
+        DetectorType.DUPLICATE_SPANS: DuplicateSpanDetector(
+            detection_settings, data, span_fingerprints
+        ),
+        DetectorType.DUPLICATE_SPANS_HASH: DuplicateSpanHashDetector(
+            detection_settings, data, span_fingerprints
+        ),
+        DetectorType.SLOW_SPAN: SlowSpanDetector(detection_settings, data, span_fingerprints),
+        DetectorType.SEQUENTIAL_SLOW_SPANS: SequentialSlowSpanDetector(
+            detection_settings, data, span_fingerprints
+        ),
+        DetectorType.LONG_TASK_SPANS: LongTaskSpanDetector(
+            detection_settings, data, span_fingerprints
+        ),
         DetectorType.RENDER_BLOCKING_ASSET_SPAN: RenderBlockingAssetSpanDetector(
-            detection_settings, data
+            detection_settings, data, span_fingerprints
+        ),
+        DetectorType.N_PLUS_ONE_SPANS: NPlusOneSpanDetector(
+            detection_settings, data, span_fingerprints
         ),
-        DetectorType.N_PLUS_ONE_SPANS: NPlusOneSpanDetector(detection_settings, data),
     }
 
+    # Bind the visitors once rather than walking the detectors dict for every span
+    span_visitors = [detector.visit_span for detector in detectors.values()]
     for span in spans:
-        for _, detector in detectors.items():
-            detector.visit_span(span)
+        for visit_span in span_visitors:
+            visit_span(span)
 
     report_metrics_for_detectors(event_id, detectors, sdk_span)
 
 
-# Creates a stable fingerprint given the same span details using sha1.
+# Creates a stable fingerprint given the same span details using 128-bit murmur3.
 def fingerprint_span(span: Span):
     op = span.get("op", None)
     description = span.get("description", None)
@@ -135,10 +154,10 @@ def fingerprint_span(span: Span):
         return None
 
     signature = (str(op) + str(description)).encode("utf-8")
-    full_fingerprint = hashlib.sha1(signature).hexdigest()
+    full_fingerprint = mmh3.hash_bytes(signature).hex()
     fingerprint = full_fingerprint[
         :20
-    ]  # 80 bits. Not a cryptographic usage, we don't need all of the sha1 for collision detection
+    ]  # 80 bits. Not a cryptographic usage, we don't need all of the hash for collision detection
 
     return fingerprint
 
@@ -151,9 +170,17 @@ def fingerprint_span_op(span: Span):
     return op
 
 
-def get_span_duration(span: Span):
-    return timedelta(seconds=span.get("timestamp", 0)) - timedelta(
-        seconds=span.get("start_timestamp", 0)
+# Detection works in whole microseconds, converted the same way timedelta(seconds=...) and
+# timedelta(milliseconds=...) convert floats: the whole part exactly, then the fraction rounded
+# half to even. Scaling the full epoch value first would round differently.
+def to_microseconds(value: float, microseconds_per_unit: int = 1_000_000) -> int:
+    fraction, whole = math.modf(value)
+    return int(whole) * microseconds_per_unit + round(fraction * microseconds_per_unit)
+
+
+def get_span_duration(span: Span) -> int:
+    return to_microseconds(span.get("timestamp", 0)) - to_microseconds(
+        span.get("start_timestamp", 0)
     )
 
 
@@ -162,18 +189,53 @@ class PerformanceDetector(ABC):
     Classes of this type have their visit functions called as the event is walked once and will store a performance issue if one is detected.
     """
 
-    def __init__(self, settings: Dict[str, Any], event: Event):
+    def __init__(
+        self,
+        settings: Dict[str, Any],
+        event: Event,
+        span_fingerprints: Optional[Dict[Tuple[str, str], str]] = None,
+    ):
         self.settings = settings[self.settings_key]
         self._event = event
+        self._span_fingerprints = {} if span_fingerprints is None else span_fingerprints
+        # Allowed ops as tuples for str.startswith, whatever sequence the settings hold
+        self._setting_span_ops: List[Tuple[Dict[str, Any], Tuple[str, ...]]] = (
+            [(setting, tuple(setting.get("allowed_span_ops", ()))) for setting in self.settings]
+            if isinstance(self.settings, list)
+            else []
+        )
+        self._allowed_span_ops = self._collect_allowed_span_ops()
         self.init()
 
+    def _collect_allowed_span_ops(self) -> Tuple[str, ...]:
+        # Every prefix any of the settings allows, so spans none of them care about are
+        # rejected in one call. Left empty when a setting allows all ops.
+        allowed_span_ops: Tuple[str, ...] = ()
+        for _setting, setting_span_ops in self._setting_span_ops:
+            if not setting_span_ops:
+                return ()
+            allowed_span_ops += setting_span_ops
+        return allowed_span_ops
+
     @abstractmethod
     def init(self):
         raise NotImplementedError
 
-    def find_span_prefix(self, settings, span_op: str):
-        allowed_span_ops = settings.get("allowed_span_ops", [])
-        if len(allowed_span_ops) <= 0:
+    def _fingerprint_span_cached(self, span: Span):
+        # Memoized by op and description in a dict that only lives as long as the event
+        op = span.get("op", None)
+        description = span.get("description", None)
+        if not description or not op:
+            return None
+
+        key = (str(op), str(description))
+        fingerprint = self._span_fingerprints.get(key)
+        if fingerprint is None:
+            fingerprint = self._span_fingerprints[key] = fingerprint_span(span)
+        return fingerprint
+
+    def find_span_prefix(self, allowed_span_ops: Tuple[str, ...], span_op: str):
+        if not allowed_span_ops:
             return True
         return next((op for op in allowed_span_ops if span_op.startswith(op)), False)
 
@@ -183,11 +245,15 @@ class PerformanceDetector(ABC):
         if not op or not span_id:
             return None
 
-        span_duration = get_span_duration(span)
-        for setting in self.settings:
-            op_prefix = self.find_span_prefix(setting, op)
+        # Most spans match none of the prefixes, reject those in one C-level call
+        if self._allowed_span_ops and not op.startswith(self._allowed_span_ops):
+            return None
+
+        for setting, allowed_span_ops in self._setting_span_ops:
+            op_prefix = self.find_span_prefix(allowed_span_ops, op)
             if op_prefix:
-                return op, span_id, op_prefix, span_duration, setting
+                # Only pay for the duration once the span is known to be relevant
+                return op, span_id, op_prefix, get_span_duration(span), setting
         return None
 
     def event(self) -> Event:
@@ -219,7 +285,7 @@ class DuplicateSpanDetector(PerformanceDetector):
 
     def init(self):
         self.cumulative_durations = {}
-        self.duplicate_spans_involved = {}
+        self.duplicate_spans_involved = defaultdict(list)
         self.stored_issues = {}
 
     def visit_span(self, span: Span):
@@ -228,26 +294,24 @@ class DuplicateSpanDetector(PerformanceDetector):
             return
         op, span_id, op_prefix, span_duration, settings = settings_for_span
         duplicate_count_threshold = settings.get("count")
-        duplicate_duration_threshold = settings.get("cumulative_duration")
+        duplicate_duration_threshold = to_microseconds(settings.get("cumulative_duration"), 1000)
 
-        fingerprint = fingerprint_span(span)
+        fingerprint = self._fingerprint_span_cached(span)
         if not fingerprint:
             return
 
         self.cumulative_durations[fingerprint] = (
-            self.cumulative_durations.get(fingerprint, timedelta(0)) + span_duration
+            self.cumulative_durations.get(fingerprint, 0) + span_duration
         )
 
-        if fingerprint not in self.duplicate_spans_involved:
-            self.duplicate_spans_involved[fingerprint] = []
-
-        self.duplicate_spans_involved[fingerprint] += [span_id]
+        self.duplicate_spans_involved[fingerprint].append(span_id)
         duplicate_spans_counts = len(self.duplicate_spans_involved[fingerprint])
 
         if not self.stored_issues.get(fingerprint, False):
-            if duplicate_spans_counts >= duplicate_count_threshold and self.cumulative_durations[
-                fingerprint
-            ] >= timedelta(milliseconds=duplicate_duration_threshold):
+            if (
+                duplicate_spans_counts >= duplicate_count_threshold
+                and self.cumulative_durations[fingerprint] >= duplicate_duration_threshold
+            ):
                 spans_involved = self.duplicate_spans_involved[fingerprint]
                 self.stored_issues[fingerprint] = PerformanceSpanIssue(
                     span_id, op_prefix, spans_involved
@@ -266,7 +330,7 @@ class DuplicateSpanHashDetector(PerformanceDetector):
 
     def init(self):
         self.cumulative_durations = {}
-        self.duplicate_spans_involved = {}
+        self.duplicate_spans_involved = defaultdict(list)
         self.stored_issues = {}
 
     def visit_span(self, span: Span):
@@ -275,26 +339,22 @@ class DuplicateSpanHashDetector(PerformanceDetector):
             return
         op, span_id, op_prefix, span_duration, settings = settings_for_span
         duplicate_count_threshold = settings.get("count")
-        duplicate_duration_threshold = settings.get("cumulative_duration")
+        duplicate_duration_threshold = to_microseconds(settings.get("cumulative_duration"), 1000)
 
         hash = span.get("hash", None)
         if not hash:
             return
 
-        self.cumulative_durations[hash] = (
-            self.cumulative_durations.get(hash, timedelta(0)) + span_duration
-        )
+        self.cumulative_durations[hash] = self.cumulative_durations.get(hash, 0) + span_duration
 
-        if hash not in self.duplicate_spans_involved:
-            self.duplicate_spans_involved[hash] = []
-
-        self.duplicate_spans_involved[hash] += [span_id]
+        self.duplicate_spans_involved[hash].append(span_id)
         duplicate_spans_counts = len(self.duplicate_spans_involved[hash])
 
         if not self.stored_issues.get(hash, False):
-            if duplicate_spans_counts >= duplicate_count_threshold and self.cumulative_durations[
-                hash
-            ] >= timedelta(milliseconds=duplicate_duration_threshold):
+            if (
+                duplicate_spans_counts >= duplicate_count_threshold
+                and self.cumulative_durations[hash] >= duplicate_duration_threshold
+            ):
                 spans_involved = self.duplicate_spans_involved[hash]
                 self.stored_issues[hash] = PerformanceSpanIssue(
                     span_id, op_prefix, spans_involved, hash
@@ -318,84 +378,87 @@ class SlowSpanDetector(PerformanceDetector):
         if not settings_for_span:
             return
         op, span_id, op_prefix, span_duration, settings = settings_for_span
-        duration_threshold = settings.get("duration_threshold")
+        duration_threshold = to_microseconds(settings.get("duration_threshold"), 1000)
 
-        fingerprint = fingerprint_span(span)
+        fingerprint = self._fingerprint_span_cached(span)
 
         if not fingerprint:
             return
 
-        if span_duration >= timedelta(
-            milliseconds=duration_threshold
-        ) and not self.stored_issues.get(fingerprint, False):
+        if span_duration >= duration_threshold and not self.stored_issues.get(fingerprint, False):
             spans_involved = [span_id]
             self.stored_issues[fingerprint] = PerformanceSpanIssue(
                 span_id, op_prefix, spans_involved
             )
 
 
+class _SequentialSpanState:
+    """
+    Everything SequentialSlowSpanDetector tracks for one span op, so a single lookup per span covers it.
+    """
+
+    __slots__ = ("last_span_end", "cumulative_duration", "spans_involved")
+
+    def __init__(self):
+        self.last_span_end: Optional[int] = None
+        self.cumulative_duration = 0
+        self.spans_involved: List[str] = []
+
+
 class SequentialSlowSpanDetector(PerformanceDetector):
     """
     Checks for unparallelized slower repeated spans, to suggest using futures etc. to reduce response time.
     This makes some assumptions about span ordering etc. and also removes any spans that have any overlap with the same span op from consideration.
     """
 
-    __slots__ = ("cumulative_durations", "stored_issues", "spans_involved", "last_span_seen")
+    __slots__ = ("span_states", "stored_issues")
 
     settings_key = DetectorType.SEQUENTIAL_SLOW_SPANS
 
     def init(self):
-        self.cumulative_durations = {}
+        self.span_states = defaultdict(_SequentialSpanState)
         self.stored_issues = {}
-        self.spans_involved = {}
-        self.last_span_seen = {}
 
     def visit_span(self, span: Span):
         settings_for_span = self.settings_for_span(span)
         if not settings_for_span:
             return
         op, span_id, op_prefix, span_duration, settings = settings_for_span
-        duration_threshold = settings.get("cumulative_duration")
+        duration_threshold = to_microseconds(settings.get("cumulative_duration"), 1000)
         count_threshold = settings.get("count")
 
         fingerprint = fingerprint_span_op(span)
         if not fingerprint:
             return
 
-        span_end = timedelta(seconds=span.get("timestamp", 0))
+        span_end = to_microseconds(span.get("timestamp", 0))
 
-        if fingerprint not in self.spans_involved:
-            self.spans_involved[fingerprint] = []
+        state = self.span_states[fingerprint]
+        state.spans_involved.append(span_id)
 
-        self.spans_involved[fingerprint] += [span_id]
-
-        if fingerprint not in self.last_span_seen:
-            self.last_span_seen[fingerprint] = span_end
-            self.cumulative_durations[fingerprint] = span_duration
+        if state.last_span_end is None:
+            state.last_span_end = span_end
+            state.cumulative_duration = span_duration
             return
 
-        last_span_end = self.last_span_seen[fingerprint]
-        current_span_start = timedelta(seconds=span.get("start_timestamp", 0))
+        current_span_start = to_microseconds(span.get("start_timestamp", 0))
 
-        are_spans_overlapping = current_span_start <= last_span_end
+        are_spans_overlapping = current_span_start <= state.last_span_end
         if are_spans_overlapping:
-            del self.last_span_seen[fingerprint]
-            self.spans_involved[fingerprint] = []
-            self.cumulative_durations[fingerprint] = timedelta(0)
+            state.last_span_end = None
+            state.spans_involved = []
+            state.cumulative_duration = 0
             return
 
-        self.cumulative_durations[fingerprint] += span_duration
-        self.last_span_seen[fingerprint] = span_end
+        state.cumulative_duration += span_duration
+        state.last_span_end = span_end
 
-        spans_counts = len(self.spans_involved[fingerprint])
+        spans_counts = len(state.spans_involved)
 
         if not self.stored_issues.get(fingerprint, False):
-            if spans_counts >= count_threshold and self.cumulative_durations[
-                fingerprint
-            ] >= timedelta(milliseconds=duration_threshold):
-                spans_involved = self.spans_involved[fingerprint]
+            if spans_counts >= count_threshold and state.cumulative_duration >= duration_threshold:
                 self.stored_issues[fingerprint] = PerformanceSpanIssue(
-                    span_id, op_prefix, spans_involved
+                    span_id, op_prefix, state.spans_involved
                 )
 
 
@@ -409,7 +472,7 @@ class LongTaskSpanDetector(PerformanceDetector):
     settings_key = DetectorType.LONG_TASK_SPANS
 
     def init(self):
-        self.cumulative_duration = timedelta(0)
+        self.cumulative_duration = 0
         self.spans_involved = []
         self.stored_issues = {}
 
@@ -418,77 +481,78 @@ class LongTaskSpanDetector(PerformanceDetector):
         if not settings_for_span:
             return
         op, span_id, op_prefix, span_duration, settings = settings_for_span
-        duration_threshold = settings.get("cumulative_duration")
+        duration_threshold = to_microseconds(settings.get("cumulative_duration"), 1000)
 
-        fingerprint = fingerprint_span(span)
+        fingerprint = self._fingerprint_span_cached(span)
         if not fingerprint:
             return
 
-        span_duration = get_span_duration(span)
         self.cumulative_duration += span_duration
         self.spans_involved.append(span_id)
 
-        if self.cumulative_duration >= timedelta(milliseconds=duration_threshold):
+        if self.cumulative_duration >= duration_threshold:
             self.stored_issues[fingerprint] = PerformanceSpanIssue(
                 span_id, op_prefix, self.spans_involved
             )
 
 
 class RenderBlockingAssetSpanDetector(PerformanceDetector):
-    __slots__ = ("stored_issues", "fcp", "transaction_start")
+    __slots__ = ("stored_issues", "fcp", "fcp_timestamp", "_allowed_ops_set", "transaction_start")
 
     settings_key = DetectorType.RENDER_BLOCKING_ASSET_SPAN
 
     def init(self):
         self.stored_issues = {}
-        self.transaction_start = timedelta(seconds=self.event().get("start_timestamp", 0))
+        self.transaction_start = to_microseconds(self.event().get("start_timestamp", 0))
         self.fcp = None
+        self.fcp_timestamp = None
+        # Ops are matched exactly here, not by prefix.
+        self._allowed_ops_set = frozenset(self.settings.get("allowed_span_ops"))
 
         # Only concern ourselves with transactions where the FCP is within the
         # range we care about.
         fcp_hash = self.event().get("measurements", {}).get("fcp", {})
         fcp_value = fcp_hash.get("value")
         if fcp_value and ("unit" not in fcp_hash or fcp_hash["unit"] == "millisecond"):
-            fcp = timedelta(milliseconds=fcp_value)
-            fcp_minimum_threshold = timedelta(
-                milliseconds=self.settings.get("fcp_minimum_threshold")
+            fcp = to_microseconds(fcp_value, 1000)
+            fcp_minimum_threshold = to_microseconds(
+                self.settings.get("fcp_minimum_threshold"), 1000
             )
-            fcp_maximum_threshold = timedelta(
-                milliseconds=self.settings.get("fcp_maximum_threshold")
+            fcp_maximum_threshold = to_microseconds(
+                self.settings.get("fcp_maximum_threshold"), 1000
             )
             if fcp >= fcp_minimum_threshold and fcp < fcp_maximum_threshold:
                 self.fcp = fcp
+                self.fcp_timestamp = self.transaction_start + self.fcp
 
     def visit_span(self, span: Span):
         if not self.fcp:
             return
 
         op = span.get("op", None)
-        allowed_span_ops = self.settings.get("allowed_span_ops")
-        if op not in allowed_span_ops:
+        if op not in self._allowed_ops_set:
             return False
 
-        if self._is_blocking_render(span):
+        span_start_timestamp = to_microseconds(span.get("start_timestamp", 0))
+        span_end_timestamp = to_microseconds(span.get("timestamp", 0))
+
+        if self._is_blocking_render(span_start_timestamp, span_end_timestamp):
             span_id = span.get("span_id", None)
-            fingerprint = fingerprint_span(span)
+            fingerprint = self._fingerprint_span_cached(span)
             if span_id and fingerprint:
                 self.stored_issues[fingerprint] = PerformanceSpanIssue(span_id, op, [span_id])
 
         # If we visit a span that starts after FCP, then we know we've already
         # seen all possible render-blocking resource spans.
-        span_start_timestamp = timedelta(seconds=span.get("start_timestamp", 0))
-        fcp_timestamp = self.transaction_start + self.fcp
-        if span_start_timestamp >= fcp_timestamp:
+        if span_start_timestamp >= self.fcp_timestamp:
             # Early return for all future span visits.
             self.fcp = None
 
-    def _is_blocking_render(self, span):
-        span_end_timestamp = timedelta(seconds=span.get("timestamp", 0))
-        fcp_timestamp = self.transaction_start + self.fcp
-        if span_end_timestamp >= fcp_timestamp:
+    def _is_blocking_render(self, span_start_timestamp: int, span_end_timestamp: int) -> bool:
+        if span_end_timestamp >= self.fcp_timestamp:
             return False
 
-        span_duration = get_span_duration(span)
+        span_duration = span_end_timestamp - span_start_timestamp
         fcp_ratio_threshold = self.settings.get("fcp_ratio_threshold")
         return span_duration / self.fcp > fcp_ratio_threshold
 
@@ -519,7 +583,7 @@ class NPlusOneSpanDetector(PerformanceDetector):
 
         op, span_id, op_prefix, span_duration, settings = settings_for_span
 
-        start_time_threshold = timedelta(milliseconds=settings.get("start_time_threshold", 0))
+        start_time_threshold = to_microseconds(settings.get("start_time_threshold", 0), 1000)
         count = settings.get("count", 10)
 
         fingerprint = fingerprint_span_op(span)
@@ -535,8 +599,8 @@ class NPlusOneSpanDetector(PerformanceDetector):
             self.most_recent_start_time[fingerprint] = 0
             self.most_recent_hash[fingerprint] = ""
 
-        delta_to_previous_span_start_time = timedelta(
-            seconds=(span["start_timestamp"] - self.most_recent_start_time[fingerprint])
+        delta_to_previous_span_start_time = to_microseconds(
+            span["start_timestamp"] - self.most_recent_start_time[fingerprint]
         )
 
         is_concurrent_with_previous_span = delta_to_previous_span_start_time < start_time_threshold
@@ -546,7 +610,7 @@ class NPlusOneSpanDetector(PerformanceDetector):
         self.most_recent_hash[fingerprint] = hash
 
         if is_concurrent_with_previous_span and has_same_hash_as_previous_span:
-            self.spans_involved[fingerprint].append(span)
+            self.spans_involved[fingerprint].append(span_id)
         else:
             self.spans_involved[fingerprint] = [span_id]
             return
@@ -562,14 +626,14 @@ class NPlusOneSpanDetector(PerformanceDetector):
 def report_metrics_for_detectors(
     event_id: Optional[str], detectors: Dict[str, PerformanceDetector], sdk_span: Any
 ):
-    all_detected_issues = [i for _, d in detectors.items() for i in d.stored_issues]
-    has_detected_issues = bool(all_detected_issues)
+    all_detected_issue_count = sum(len(d.stored_issues) for d in detectors.values())
+    has_detected_issues = all_detected_issue_count > 0
 
     if has_detected_issues:
-        sdk_span.containing_transaction.set_tag("_pi_all_issue_count", len(all_detected_issues))
+        sdk_span.containing_transaction.set_tag("_pi_all_issue_count", all_detected_issue_count)
         metrics.incr(
             "performance.performance_issue.aggregate",
-            len(all_detected_issues),
+            all_detected_issue_count,
         )
         if event_id:
             sdk_span.containing_transaction.set_tag("_pi_transaction", event_id)
@@ -578,13 +642,12 @@ def report_metrics_for_detectors(
     for detector_enum, detector in detectors.items():
         detector_key = detector_enum.value
         detected_issues = detector.stored_issues
-        detected_issue_keys = list(detected_issues.keys())
-        detected_tags[detector_key] = bool(len(detected_issue_keys))
+        detected_tags[detector_key] = bool(detected_issues)
 
-        if not detected_issue_keys:
+        if not detected_issues:
             continue
 
-        first_issue = detected_issues[detected_issue_keys[0]]
+        first_issue = next(iter(detected_issues.values()))
         if first_issue.fingerprint:
             sdk_span.containing_transaction.set_tag(
                 f"_pi_{detector_key}_fp", first_issue.fingerprint
@@ -592,7 +655,7 @@ def report_metrics_for_detectors(
         sdk_span.containing_transaction.set_tag(f"_pi_{detector_key}", first_issue.span_id)
         metrics.incr(
             f"performance.performance_issue.{detector_key}",
-            len(detected_issue_keys),
+            len(detected_issues),
             tags={f"op_{n.allowed_op}": True for n in detected_issues.values()},
         )
 
@@ -3,13 +3,15 @@ from sentry.testutils.helpers.datetime import before_now, iso_format
 
 
 class GroupTagKeyValuesTest(APITestCase, SnubaTestCase):
+    DEFAULT_TS = iso_format(before_now(seconds=1))
+
     def test_simple(self):
         key, value = "foo", "bar"
 
         project = self.create_project()
 
         event = self.store_event(
-            data={"tags": {key: value}, "timestamp": iso_format(before_now(seconds=1))},
+            data={"tags": {key: value}, "timestamp": self.DEFAULT_TS},
             project_id=project.id,
         )
         group = event.group
@@ -35,7 +37,7 @@ class GroupTagKeyValuesTest(APITestCase, SnubaTestCase):
                     "username": "foo",
                     "ip_address": "127.0.0.1",
                 },
-                "timestamp": iso_format(before_now(seconds=1)),
+                "timestamp": self.DEFAULT_TS,
             },
             project_id=project.id,
         )
@@ -84,50 +86,27 @@ class GroupTagKeyValuesTest(APITestCase, SnubaTestCase):
 
         assert response.data[0]["value"] == "minidumpC:\\Users\\test"
 
-    def test_count_sort(self):
-        project = self.create_project()
-        event = self.store_event(
+    def _store_user_event(self, project, user_id, email, username):
+        return self.store_event(
             data={
                 "message": "message 1",
                 "platform": "python",
                 "user": {
-                    "id": 1,
-                    "email": "foo@example.com",
-                    "username": "foo",
+                    "id": user_id,
+                    "email": email,
+                    "username": username,
                     "ip_address": "127.0.0.1",
                 },
-                "timestamp": iso_format(before_now(seconds=1)),
-            },
-            project_id=project.id,
-        )
-        self.store_event(
-            data={
-                "message": "message 1",
-                "platform": "python",
-                "user": {
-                    "id": 1,
-                    "email": "foo@example.com",
-                    "username": "foo",
-                    "ip_address": "127.0.0.1",
-                },
-                "timestamp": iso_format(before_now(seconds=1)),
-            },
-            project_id=project.id,
-        )
-        self.store_event(
-            data={
-                "message": "message 1",
-                "platform": "python",
-                "user": {
-                    "id": 2,
-                    "email": "bar@example.com",
-                    "username": "bar",
-                    "ip_address": "127.0.0.1",
-                },
-                "timestamp": iso_format(before_now(seconds=1)),
+                "timestamp": self.DEFAULT_TS,
             },
             project_id=project.id,
         )
+
+    def test_count_sort(self):
+        project = self.create_project()
+        event = self._store_user_event(project, 1, "foo@example.com", "foo")
+        self._store_user_event(project, 1, "foo@example.com", "foo")
+        self._store_user_event(project, 2, "bar@example.com", "bar")
         group = event.group
 
         self.login_as(user=self.user)
@@ -61,3 +61,75 @@
 #             self.alert_rule_valid_team.owner.get_actor_identifier()
 #             == self.valid_team.get_actor_identifier()
 #         )
+
+
+from importlib import import_module
+
+from django.apps import apps
+
+from sentry.incidents.models import AlertRule
+from sentry.models import Actor
+from sentry.testutils import TestCase
+
+backfill_alert_owners = import_module(
+    "sentry.migrations.0297_backfill_alert_owners"
+).backfill_alert_owners
+
+
+# Runs the backfill function directly against the current schema, since the migration test above
+# can't be rolled back reliably.
+class BackfillAlertOwnersTest(TestCase):
+    def test(self):
+        new_user = self.create_user("b@example.com")
+        alert_rule_invalid_user = self.create_alert_rule(
+            name="test_alert_invalid_user",
+            organization=self.organization,
+            projects=[self.project],
+            owner=new_user.actor.get_actor_tuple(),
+        )
+        alert_rule_valid_user = self.create_alert_rule(
+            name="test_alert_valid_user",
+            organization=self.organization,
+            projects=[self.project],
+            owner=self.user.actor.get_actor_tuple(),
+        )
+
+        organization = self.create_organization(name="New Org", owner=new_user)
+        new_team = self.create_team(organization=organization, name="New Team", members=[self.user])
+        alert_rule_invalid_team = self.create_alert_rule(
+            name="test_alert_invalid_team",
+            organization=self.organization,
+            projects=[self.project],
+            owner=new_team.actor.get_actor_tuple(),
+        )
+        alert_rule_valid_team = self.create_alert_rule(
+            name="test_alert_valid_team",
+            organization=self.organization,
+            projects=[self.project],
+            owner=self.team.actor.get_actor_tuple(),
+        )
+
+        alert_rule_missing_user = self.create_alert_rule(
+            name="test_alert_missing_user",
+            organization=self.organization,
+            projects=[self.project],
+        )
+        AlertRule.objects_with_snapshots.filter(id=alert_rule_missing_user.id).update(
+            owner=Actor.objects.create(type=1)
+        )
+
+        backfill_alert_owners(apps, None)
+
+        for alert_rule in (
+            alert_rule_invalid_user,
+            alert_rule_invalid_team,
+            alert_rule_missing_user,
+        ):
+            alert_rule.refresh_from_db()
+            assert alert_rule.owner is None
+
+        alert_rule_valid_user.refresh_from_db()
+        assert alert_rule_valid_user.owner_id == self.user.actor_id
+
+        alert_rule_valid_team.refresh_from_db()
+        assert alert_rule_valid_team.owner_id == self.team.actor_id
@@ -0,0 +1,19 @@
+from sentry.rules.conditions.reappeared_event import ReappearedEventCondition
+from sentry.rules.conditions.regression_event import RegressionEventCondition
+from sentry.testutils.cases import RuleTestCase
+
+
+class SimpleEventConditionTest(RuleTestCase):
+    # Conditions that only mirror a single EventState flag
+    conditions = [
+        (ReappearedEventCondition, "has_reappeared"),
+        (RegressionEventCondition, "is_regression"),
+    ]
+
+    def test_applies_correctly(self):
+        for rule_cls, state_flag in self.conditions:
+            rule = rule_cls(project=self.project, data={})
+
+            self.assertPasses(rule, self.event, **{state_flag: True})
+
+            self.assertDoesNotPass(rule, self.event, **{state_flag: False})
@@ -5,8 +5,15 @@ from unittest.mock import Mock, call, patch
 from sentry.testutils.helpers import override_options
 from sentry.utils import json
 from sentry.utils.performance_issues.performance_detection import (
+    DetectorType,
+    DuplicateSpanDetector,
+    NPlusOneSpanDetector,
+    SequentialSlowSpanDetector,
+    SlowSpanDetector,
     _detect_performance_issue,
     detect_performance_issue,
+    fingerprint_span,
+    get_default_detection_settings,
 )
 from tests.sentry.spans.grouping.test_strategy import SpanBuilder
 
@@ -190,6 +197,20 @@ class PerformanceDetectionTest(unittest.TestCase):
             ]
         )
 
+    def test_allowed_span_ops_as_list(self):
+        slow_span = create_span("db.query", 1001.0)
+        settings = {
+            DetectorType.SLOW_SPAN: [
+                {"duration_threshold": 1000.0, "allowed_span_ops": ["http", "db"]},
+            ]
+        }
+
+        detector = SlowSpanDetector(settings, create_event([slow_span]))
+        detector.visit_span(slow_span)
+
+        [issue] = detector.stored_issues.values()
+        assert issue.allowed_op == "db"
+
     def test_calls_slow_span_threshold(self):
         http_span_event = create_event(
             [create_span("http.client", 1001.0, "http://example.com")] * 1
@@ -247,6 +268,71 @@ class PerformanceDetectionTest(unittest.TestCase):
             ]
         )
 
+    def test_n_plus_one_spans_involved_are_span_ids(self):
+        spans = [create_span("http.client", 250, "GET /list.json")]
+        for i, start in enumerate((101, 105, 109), start=1):
+            span = modify_span_start(
+                create_span("http.client", 180, f"GET /events.json?q={i}", "c0c0c0c0"), start
+            )
+            span["span_id"] = str(i) * 16
+            spans.append(span)
+        n_plus_one_event = create_event(spans)
+
+        detector = NPlusOneSpanDetector(get_default_detection_settings(), n_plus_one_event)
+        for span in spans:
+            detector.visit_span(span)
+
+        [issue] = detector.stored_issues.values()
+        assert issue.spans_involved == ["1" * 16, "2" * 16, "3" * 16]
+
+    def test_thresholds_met_exactly_with_epoch_timestamps(self):
+        # Float sums of these durations fall just short of 500ms and 1200ms
+        duplicate_spans = []
+        for i in range(5):
+            span = create_span("db", 100.0)
+            span["start_timestamp"] = 1656400000.0 + i * 0.1
+            span["timestamp"] = span["start_timestamp"] + 0.1
+            duplicate_spans.append(span)
+
+        sequential_spans = []
+        for start, end in [
+            (1656400000.124453, 1656400000.524453),
+            (1656400000.624453, 1656400001.024453),
+            (1656400001.124453, 1656400001.524453),
+        ]:
+            span = create_span("db", 400.0)
+            span["start_timestamp"] = start
+            span["timestamp"] = end
+            sequential_spans.append(span)
+
+        # Rounds to exactly 1000ms only when each timestamp is rounded to microseconds on its own
+        slow_span = create_span("db", 1000.0)
+        slow_span["start_timestamp"] = 1656400878.8666604
+        slow_span["timestamp"] = 1656400879.8666596
+
+        for detector_cls, spans in [
+            (DuplicateSpanDetector, duplicate_spans),
+            (SequentialSlowSpanDetector, sequential_spans),
+            (SlowSpanDetector, [slow_span]),
+        ]:
+            detector = detector_cls(get_default_detection_settings(), create_event(spans))
+            for span in spans:
+                detector.visit_span(span)
+            assert len(detector.stored_issues) == 1, detector_cls
+
+    def test_fingerprints_each_span_once_per_event(self):
+        duplicate_event = create_event([create_span("db", 100.0) for _ in range(5)])
+
+        with patch(
+            "sentry.utils.performance_issues.performance_detection.fingerprint_span",
+            wraps=fingerprint_span,
+        ) as fingerprint_mock:
+            _detect_performance_issue(duplicate_event, Mock())
+            assert fingerprint_mock.call_count == 1
+
+            _detect_performance_issue(duplicate_event, Mock())
+            assert fingerprint_mock.call_count == 2
+
     def test_calls_detect_sequential(self):
         no_sequential_event = create_event([create_span("db", 999.0)] * 4)
         sequential_event = create_event(
@@ -10,7 +10,6 @@ class ProjectEventDetailsTest(APITestCase, SnubaTestCase):
         self.login_as(user=self.user)
         project = self.create_project()
 
-        one_min_ago = iso_format(before_now(minutes=1))
         two_min_ago = iso_format(before_now(minutes=2))
         three_min_ago = iso_format(before_now(minutes=3))
         four_min_ago = iso_format(before_now(minutes=4))
@@ -34,27 +33,31 @@ class ProjectEventDetailsTest(APITestCase, SnubaTestCase):
             project_id=project.id,
         )
 
-        # Event in different group
+    def _store_different_group_event(self):
+        # Event in different group, only stored by the tests that check it is skipped
         self.store_event(
             data={
                 "event_id": "d" * 32,
-                "timestamp": one_min_ago,
+                "timestamp": iso_format(before_now(minutes=1)),
                 "fingerprint": ["group-2"],
                 "environment": "production",
                 "tags": {"environment": "production"},
             },
-            project_id=project.id,
+            project_id=self.cur_event.project_id,
         )
 
-    def test_simple(self):
-        url = reverse(
+    def _detail_url(self, event):
+        return reverse(
             "sentry-api-0-project-event-details",
             kwargs={
-                "event_id": self.cur_event.event_id,
-                "project_slug": self.cur_event.project.slug,
-                "organization_slug": self.cur_event.project.organization.slug,
+                "event_id": event.event_id,
+                "project_slug": event.project.slug,
+                "organization_slug": event.project.organization.slug,
             },
         )
+
+    def test_simple(self):
+        url = self._detail_url(self.cur_event)
         response = self.client.get(url, format="json")
 
         assert response.status_code == 200, response.content
@@ -64,14 +67,7 @@ class ProjectEventDetailsTest(APITestCase, SnubaTestCase):
         assert response.data["groupID"] == str(self.cur_event.group.id)
 
     def test_snuba_no_prev(self):
-        url = reverse(
-            "sentry-api-0-project-event-details",
-            kwargs={
-                "event_id": self.prev_event.event_id,
-                "project_slug": self.prev_event.project.slug,
-                "organization_slug": self.prev_event.project.organization.slug,
-            },
-        )
+        url = self._detail_url(self.prev_event)
         response = self.client.get(url, format="json")
 
         assert response.status_code == 200, response.content
@@ -81,14 +77,8 @@ class ProjectEventDetailsTest(APITestCase, SnubaTestCase):
         assert response.data["groupID"] == str(self.prev_event.group.id)
 
     def test_snuba_with_environment(self):
-        url = reverse(
-            "sentry-api-0-project-event-details",
-            kwargs={
-                "event_id": self.cur_event.event_id,
-                "project_slug": self.cur_event.project.slug,
-                "organization_slug": self.cur_event.project.organization.slug,
-            },
-        )
+        self._store_different_group_event()
+        url = self._detail_url(self.cur_event)
         response = self.client.get(
             url, format="json", data={"environment": ["production", "staging"]}
         )
@@ -100,14 +90,8 @@ class ProjectEventDetailsTest(APITestCase, SnubaTestCase):
         assert response.data["groupID"] == str(self.prev_event.group.id)
 
     def test_ignores_different_group(self):
-        url = reverse(
-            "sentry-api-0-project-event-details",
-            kwargs={
-                "event_id": self.next_event.event_id,
-                "project_slug": self.next_event.project.slug,
-                "organization_slug": self.next_event.project.organization.slug,
-            },
-        )
+        self._store_different_group_event()
+        url = self._detail_url(self.next_event)
         response = self.client.get(url, format="json")
 
         assert response.status_code == 200, response.content